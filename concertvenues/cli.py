@@ -1,18 +1,24 @@
 import argparse
+import contextlib
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from concertvenues import __version__
 import concertvenues.config as cfg_module
 import concertvenues.db as db_module
-from concertvenues.scrapers import SCRAPERS
 from concertvenues.generator.build import build_site
+from concertvenues.models import Venue
+from concertvenues.scrapers import SCRAPERS
+from concertvenues.scrapers._http import MAX_WORKERS, set_cache_path
+from concertvenues.scrapers._playwright_pool import close_browser
 
 
-def _scrape(args, cfg):
-    db_path = cfg_module.get_database_path(cfg)
-    conn = db_module.connect(db_path)
-    enabled_venues = cfg_module.get_venues(cfg)
+def _scrape(args, site_cfg: cfg_module.SiteCfg):
+    conn = db_module.connect(site_cfg.database_path)
+    # Keep the HTTP cache beside the database rather than in the working directory
+    set_cache_path(site_cfg.database_path.parent / "http_cache")
+    enabled_venues = site_cfg.venues
 
     targets = {}
     if args.venue:
@@ -28,47 +34,74 @@ def _scrape(args, cfg):
         print("No enabled scrapers found. Check your config.toml [venues] section.")
         return
 
-    for key, scraper_cls in targets.items():
-        venue_cfg = enabled_venues.get(key, {})
-        scraper = scraper_cls(venue_cfg)
-        print(f"Scraping {scraper.venue_name} ...", end=" ", flush=True)
-        try:
-            # Ensure the venue row exists before inserting events
-            from concertvenues.models import Venue
-            db_module.upsert_venue(conn, Venue(
-                key=key,
-                name=scraper.venue_name,
-                city=venue_cfg.get("city", ""),
-                url=venue_cfg.get("url", ""),
-            ))
-            events = scraper.fetch_events()
-            for event in events:
-                db_module.upsert_event(conn, event)
-            print(f"{len(events)} events saved.")
-        except Exception as exc:
-            print(f"FAILED ({exc})")
-
-    removed = db_module.delete_past_events(conn)
+    # One transaction for every venue's writes plus the cleanup below
+    with conn:
+        with contextlib.ExitStack() as stack:
+            if any(scraper_cls.uses_browser for scraper_cls in targets.values()):
+                # Browser scrapers share one Chromium, launched on first use;
+                # shut it down once scraping is done
+                stack.callback(close_browser)
+
+            scrapers = {
+                key: scraper_cls(enabled_venues.get(key, {}))
+                for key, scraper_cls in targets.items()
+            }
+            for key, scraper in scrapers.items():
+                # Ensure the venue row exists before inserting events
+                venue_cfg = enabled_venues.get(key, {})
+                db_module.upsert_venue(conn, Venue(
+                    key=key,
+                    name=scraper.venue_name,
+                    city=venue_cfg.get("city", ""),
+                    url=venue_cfg.get("url", ""),
+                ))
+
+            # Scrapers are I/O-bound, so fetch concurrently; the sqlite3 connection is
+            # not shared across threads, so all DB writes stay on this thread.
+            print(f"Scraping {len(scrapers)} venue(s) ...", flush=True)
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(scrapers))) as pool:
+                # Workers drain each scraper's iterator so parsing happens off
+                # the main thread; only the DB writes happen here.
+                futures = {
+                    pool.submit(lambda s: list(s.fetch_events()), scraper): scraper
+                    for scraper in scrapers.values()
+                    if not scraper.uses_browser
+                }
+                # Playwright's sync API is bound to the thread that started it, so
+                # browser scrapers run (and stream into the DB) here while the
+                # pool handles the rest.
+                for scraper in scrapers.values():
+                    if scraper.uses_browser:
+                        _save_events(conn, scraper, scraper.fetch_events)
+                for future in as_completed(futures):
+                    _save_events(conn, futures[future], future.result)
+
+        removed = db_module.delete_past_events(conn)
+
     if removed:
         print(f"Cleaned up {removed} past events from the database.")
 
 
-def _serve(args, cfg):
+def _save_events(conn, scraper, fetch) -> None:
+    try:
+        saved = db_module.upsert_events_bulk(conn, fetch())
+        print(f"  {scraper.venue_name}: {saved} events saved.")
+    except Exception as exc:
+        print(f"  {scraper.venue_name}: FAILED ({exc})")
+
+
+def _serve(args, site_cfg: cfg_module.SiteCfg):
+    import functools
     import http.server
-    import os
-    import socketserver
     import webbrowser
 
-    site_cfg = cfg_module.get_site(cfg)
-    output_dir = Path(site_cfg.get("output_dir", "output"))
+    output_dir = site_cfg.output_dir
     port = args.port
 
     if not output_dir.exists() or not any(output_dir.iterdir()):
         print(f"'{output_dir}' is empty or missing. Run 'cv generate' first.")
         sys.exit(1)
 
-    os.chdir(output_dir)
-
     class _Handler(http.server.SimpleHTTPRequestHandler):
         def log_message(self, format, *args):
             print(f"  {self.command} {self.path}")
@@ -78,22 +111,21 @@ def _serve(args, cfg):
     print("Press Ctrl+C to stop.\n")
     webbrowser.open(url)
 
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer(("", port), _Handler) as httpd:
+    # One thread per request so a page's assets load in parallel; serve
+    # from output_dir without changing the process's working directory
+    handler = functools.partial(_Handler, directory=str(output_dir))
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
+        httpd.daemon_threads = True
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\nServer stopped.")
 
 
-def _generate(args, cfg):
-    site_cfg = cfg_module.get_site(cfg)
-    db_path = cfg_module.get_database_path(cfg)
-    conn = db_module.connect(db_path)
-    days_ahead = site_cfg.get("days_ahead", 90)
-    output_dir = Path(site_cfg.get("output_dir", "output"))
-    build_site(conn, cfg, output_dir)
-    print(f"Site generated in '{output_dir}/'.")
+def _generate(args, site_cfg: cfg_module.SiteCfg):
+    conn = db_module.connect(site_cfg.database_path)
+    build_site(conn, site_cfg)
+    print(f"Site generated in '{site_cfg.output_dir}/'.")
 
 
 def main():
@@ -134,17 +166,17 @@ def main():
     )
 
     args = parser.parse_args()
-    cfg = cfg_module.load(Path(args.config))
+    site_cfg = cfg_module.SiteCfg.from_dict(cfg_module.load(Path(args.config)))
 
     if args.command == "scrape":
-        _scrape(args, cfg)
+        _scrape(args, site_cfg)
     elif args.command == "generate":
-        _generate(args, cfg)
+        _generate(args, site_cfg)
     elif args.command == "serve":
-        _serve(args, cfg)
+        _serve(args, site_cfg)
     elif args.command == "run":
-        _scrape(args, cfg)
-        _generate(args, cfg)
+        _scrape(args, site_cfg)
+        _generate(args, site_cfg)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
+import functools
 import os
 import tomllib
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -7,8 +9,39 @@ _DEFAULT_CONFIG_PATH = Path("config.toml")
 _DEFAULT_ENV_PATH = Path("secrets")
 
 
+@dataclass(frozen=True)
+class SiteCfg:
+    """Resolved settings from config.toml, built once per CLI invocation."""
+    title: str
+    base_url: str
+    output_dir: Path
+    days_ahead: int
+    database_path: Path
+    venues: dict[str, dict]    # enabled venues only, keyed by venue_key
+
+    @classmethod
+    def from_dict(cls, cfg: dict) -> "SiteCfg":
+        site = cfg.get("site", {})
+        venues = cfg.get("venues", {})
+        return cls(
+            title=site.get("title", "Upcoming Concerts in London"),
+            base_url=site.get("base_url", "").rstrip("/"),
+            output_dir=Path(site.get("output_dir", "output")),
+            days_ahead=site.get("days_ahead", 90),
+            database_path=Path(cfg.get("database", {}).get("path", "data/events.db")),
+            venues={key: v for key, v in venues.items() if v.get("enabled", True)},
+        )
+
+
 def load(path: Path = _DEFAULT_CONFIG_PATH) -> dict[str, Any]:
     """Load config from TOML, then overlay any secrets from .env."""
+    path = Path(path)
+    # Keyed on mtime so an edited config.toml is picked up again
+    return _load_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int) -> dict[str, Any]:
     with open(path, "rb") as f:
         cfg = tomllib.load(f)
     _load_env(_DEFAULT_ENV_PATH, cfg)
@@ -49,17 +82,3 @@ def _apply_env_vars(cfg: dict) -> None:
     secrets = cfg.setdefault("secrets", {})
     if v := os.environ.get("TICKETMASTER_API_KEY"):
         secrets["ticketmaster_api_key"] = v
-
-
-def get_site(cfg: dict) -> dict:
-    return cfg.get("site", {})
-
-
-def get_database_path(cfg: dict) -> Path:
-    return Path(cfg.get("database", {}).get("path", "data/events.db"))
-
-
-def get_venues(cfg: dict) -> dict[str, dict]:
-    """Return the venues section, filtering to only enabled venues."""
-    venues = cfg.get("venues", {})
-    return {key: v for key, v in venues.items() if v.get("enabled", True)}
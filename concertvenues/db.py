@@ -1,15 +1,54 @@
 import sqlite3
-from datetime import date, datetime, time
+from collections.abc import Iterable
+from datetime import date, time
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from concertvenues.models import Event, Venue
+from concertvenues.models import Event, EventRow, Venue
+
+_UPSERT_VENUE_SQL = """
+    INSERT INTO venues (key, name, city, url)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        name = excluded.name,
+        city = excluded.city,
+        url  = excluded.url
+"""
+
+_EVENT_COLUMN_COUNT = 10
+# SQLite builds before 3.32 cap a statement at 999 bound parameters
+_EVENT_ROWS_PER_INSERT = 999 // _EVENT_COLUMN_COUNT
+_EVENT_ROW_PLACEHOLDER = "(" + ", ".join("?" * _EVENT_COLUMN_COUNT) + ")"
+
+# {values} is filled with one placeholder group per row
+_UPSERT_EVENTS_SQL = """
+    INSERT INTO events (venue_key, title, date, time, url, description, image_url, on_sale_date, price, sold_out)
+    VALUES {values}
+    ON CONFLICT(venue_key, url, date) DO UPDATE SET
+        title        = excluded.title,
+        time         = excluded.time,
+        description  = excluded.description,
+        image_url    = excluded.image_url,
+        on_sale_date = excluded.on_sale_date,
+        price        = excluded.price,
+        sold_out     = excluded.sold_out
+"""
+_UPSERT_EVENT_SQL = _UPSERT_EVENTS_SQL.format(values=_EVENT_ROW_PLACEHOLDER)
+_UPSERT_EVENTS_CHUNK_SQL = _UPSERT_EVENTS_SQL.format(
+    values=", ".join([_EVENT_ROW_PLACEHOLDER] * _EVENT_ROWS_PER_INSERT)
+)
 
 
 def connect(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # WAL + NORMAL sync: one fsync per checkpoint instead of two per commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # 20 MB
     _create_schema(conn)
     return conn
 
@@ -37,6 +76,9 @@ def _create_schema(conn: sqlite3.Connection) -> None:
             sold_out     INTEGER NOT NULL DEFAULT 0,
             UNIQUE(venue_key, url, date)
         );
+
+        CREATE INDEX IF NOT EXISTS idx_events_date ON events(date, time);
+        CREATE INDEX IF NOT EXISTS idx_events_venue_date ON events(venue_key, date);
     """)
     conn.commit()
     _migrate(conn)
@@ -55,18 +97,7 @@ def _migrate(conn: sqlite3.Connection) -> None:
 # --- Venues ---
 
 def upsert_venue(conn: sqlite3.Connection, venue: Venue) -> None:
-    conn.execute(
-        """
-        INSERT INTO venues (key, name, city, url)
-        VALUES (:key, :name, :city, :url)
-        ON CONFLICT(key) DO UPDATE SET
-            name = excluded.name,
-            city = excluded.city,
-            url  = excluded.url
-        """,
-        {"key": venue.key, "name": venue.name, "city": venue.city, "url": venue.url},
-    )
-    conn.commit()
+    conn.execute(_UPSERT_VENUE_SQL, (venue.key, venue.name, venue.city, venue.url))
 
 
 def get_all_venues(conn: sqlite3.Connection) -> list[Venue]:
@@ -77,25 +108,46 @@ def get_all_venues(conn: sqlite3.Connection) -> list[Venue]:
 # --- Events ---
 
 def upsert_event(conn: sqlite3.Connection, event: Event) -> None:
-    conn.execute(
-        """
-        INSERT OR REPLACE INTO events (venue_key, title, date, time, url, description, image_url, on_sale_date, price, sold_out)
-        VALUES (:venue_key, :title, :date, :time, :url, :description, :image_url, :on_sale_date, :price, :sold_out)
-        """,
-        {
-            "venue_key":    event.venue_key,
-            "title":        event.title,
-            "date":         event.date.isoformat(),
-            "time":         event.time.isoformat() if event.time else None,
-            "url":          event.url,
-            "description":  event.description,
-            "image_url":    event.image_url,
-            "on_sale_date": event.on_sale_date.isoformat() if event.on_sale_date else None,
-            "price":        event.price,
-            "sold_out":     1 if event.sold_out else 0,
-        },
+    conn.execute(_UPSERT_EVENT_SQL, _event_to_params(event))
+
+
+def upsert_events_bulk(conn: sqlite3.Connection, events: Iterable[Event]) -> int:
+    """
+    Insert or update many events and return how many were written.
+
+    Rows are written with multi-row INSERT statements, chunked so that each
+    statement stays under SQLite's default 999 bound-parameter limit. `events`
+    is consumed one chunk at a time, so generators are never fully buffered.
+    Like the other write helpers this does not commit; wrap calls in
+    ``with conn:``.
+    """
+    params = map(_event_to_params, events)
+    count = 0
+    while chunk := list(islice(params, _EVENT_ROWS_PER_INSERT)):
+        if len(chunk) == _EVENT_ROWS_PER_INSERT:
+            sql = _UPSERT_EVENTS_CHUNK_SQL
+        else:
+            sql = _UPSERT_EVENTS_SQL.format(
+                values=", ".join([_EVENT_ROW_PLACEHOLDER] * len(chunk))
+            )
+        conn.execute(sql, [value for row in chunk for value in row])
+        count += len(chunk)
+    return count
+
+
+def _event_to_params(event: Event) -> tuple:
+    return (
+        event.venue_key,
+        event.title,
+        event.date.isoformat(),
+        event.time.isoformat() if event.time else None,
+        event.url,
+        event.description,
+        event.image_url,
+        event.on_sale_date.isoformat() if event.on_sale_date else None,
+        event.price,
+        1 if event.sold_out else 0,
     )
-    conn.commit()
 
 
 def get_upcoming_events(
@@ -117,10 +169,38 @@ def get_upcoming_events(
     return [_row_to_event(r) for r in rows]
 
 
+def get_upcoming_events_with_venues(
+    conn: sqlite3.Connection,
+    from_date: date | None = None,
+    days_ahead: int = 90,
+) -> list[EventRow]:
+    """Return upcoming event rows joined with their venue's name and URL."""
+    start = (from_date or date.today()).isoformat()
+    end = date.fromordinal(date.fromisoformat(start).toordinal() + days_ahead).isoformat()
+    cursor = conn.cursor()
+    # Build tuples directly instead of sqlite3.Row / Event objects
+    cursor.row_factory = _event_row_factory
+    return cursor.execute(
+        """
+        SELECT e.id, e.venue_key, e.title, e.date, e.time, e.url, e.price, e.sold_out,
+               COALESCE(v.name, e.venue_key) AS venue_name,
+               v.url AS venue_url
+        FROM events e
+        LEFT JOIN venues v ON v.key = e.venue_key
+        WHERE e.date >= ? AND e.date <= ?
+        ORDER BY e.date, e.time
+        """,
+        (start, end),
+    ).fetchall()
+
+
+def _event_row_factory(cursor: sqlite3.Cursor, row: tuple) -> EventRow:
+    return EventRow._make(row)
+
+
 def delete_past_events(conn: sqlite3.Connection) -> int:
     today = date.today().isoformat()
     cursor = conn.execute("DELETE FROM events WHERE date < ?", (today,))
-    conn.commit()
     return cursor.rowcount
 
 
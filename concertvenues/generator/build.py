@@ -1,40 +1,40 @@
 import calendar
-import json
+import os
 import shutil
 import sqlite3
-from collections import defaultdict
-from datetime import date, datetime, time
+from datetime import date
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 import concertvenues.config as cfg_module
 import concertvenues.db as db_module
-from concertvenues.models import Event, Venue
+from concertvenues.models import EventRow
 
 
-def _event_to_dict(event: Event, venue: Venue | None) -> dict:
-    """Serialise an Event to a plain dict for JSON embedding in the template."""
-    if event.time:
-        time_str = event.time.strftime("%H:%M")
-        hour = event.time.hour
-        time_of_day = "evening" if hour >= 17 else "daytime"
+def _event_row_to_dict(row: EventRow) -> dict:
+    """Serialise an event row to a plain dict for JSON embedding in the template."""
+    if row.time:
+        # Stored as time.isoformat() ("HH:MM:SS"), so slice rather than parse
+        time_str = row.time[:5]
+        time_of_day = "evening" if int(time_str[:2]) >= 17 else "daytime"
     else:
         time_str = None
         time_of_day = "unknown"
 
     return {
-        "id": event.id,
-        "title": event.title,
-        "url": event.url,
-        "date": event.date.isoformat(),
+        "id": row.id,
+        "title": row.title,
+        "url": row.url,
+        "date": row.date,
         "time": time_str,
         "time_of_day": time_of_day,
-        "price": event.price,
-        "sold_out": event.sold_out,
-        "venue_key": event.venue_key,
-        "venue_name": venue.name if venue else event.venue_key,
-        "venue_url": venue.url if venue else None,
+        "price": row.price,
+        "sold_out": bool(row.sold_out),
+        "venue_key": row.venue_key,
+        "venue_name": row.venue_name,
+        "venue_url": row.venue_url,
     }
 
 
@@ -70,17 +70,16 @@ def _build_months(today: date, days_ahead: int) -> list[dict]:
     return months
 
 
-def build_site(conn: sqlite3.Connection, cfg: dict, output_dir: Path) -> None:
-    site_cfg = cfg_module.get_site(cfg)
-    days_ahead = site_cfg.get("days_ahead", 62)
-    base_url = site_cfg.get("base_url", "").rstrip("/")
-    site_title = site_cfg.get("title", "Upcoming Concerts in London")
+def build_site(conn: sqlite3.Connection, site_cfg: cfg_module.SiteCfg) -> None:
+    days_ahead = site_cfg.days_ahead
+    output_dir = site_cfg.output_dir
+    site_title = site_cfg.title
 
     today = date.today()
 
     # Load data from DB
-    events = db_module.get_upcoming_events(conn, days_ahead=days_ahead)
-    venues = {v.key: v for v in db_module.get_all_venues(conn)}
+    event_rows = db_module.get_upcoming_events_with_venues(conn, days_ahead=days_ahead)
+    venues = db_module.get_all_venues(conn)
 
     # Prepare output directory
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -91,31 +90,35 @@ def build_site(conn: sqlite3.Connection, cfg: dict, output_dir: Path) -> None:
     if static_src.exists():
         if static_dst.exists():
             shutil.rmtree(static_dst)
-        shutil.copytree(static_src, static_dst)
+        shutil.copytree(static_src, static_dst, copy_function=_link_or_copy)
 
-    # Set up Jinja2
+    # Set up Jinja2 — compiled templates are cached on disk between runs
+    # (entries are keyed on template source, so edits invalidate them)
+    bytecode_dir = Path(".jinja_cache")
+    bytecode_dir.mkdir(exist_ok=True)
     env = Environment(
         loader=FileSystemLoader("templates"),
         autoescape=select_autoescape(["html"]),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+        auto_reload=False,
+        cache_size=-1,
     )
-    env.globals["base_url"] = base_url
+    env.globals["base_url"] = site_cfg.base_url
     env.globals["site_title"] = site_title
     env.globals["generated_date"] = today.isoformat()
 
     # Serialise events to JSON for JS filter engine
-    events_json = json.dumps(
-        [_event_to_dict(e, venues.get(e.venue_key)) for e in events],
-        ensure_ascii=False,
-    )
+    events_json = orjson.dumps([_event_row_to_dict(r) for r in event_rows]).decode()
 
     # Build month grids
     months = _build_months(today, days_ahead)
 
     # Venue list for filter UI
+    active_keys = {r.venue_key for r in event_rows}
     venue_list = [
         {"key": v.key, "name": v.name}
-        for v in sorted(venues.values(), key=lambda v: v.name)
-        if any(e.venue_key == v.key for e in events)
+        for v in sorted(venues, key=lambda v: v.name)
+        if v.key in active_keys
     ]
 
     # Render index page
@@ -128,6 +131,14 @@ def build_site(conn: sqlite3.Connection, cfg: dict, output_dir: Path) -> None:
     })
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst (metadata-only), falling back to a copy across devices."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def _render(env: Environment, template_name: str, dest: Path, context: dict) -> None:
     template = env.get_template(template_name)
     dest.write_text(template.render(**context), encoding="utf-8")
@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import date, time
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Venue:
     key: str           # Unique identifier, matches config.toml section and scraper venue_key
     name: str
@@ -11,7 +11,7 @@ class Venue:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     venue_key: str     # Foreign key to Venue.key
     title: str
@@ -25,3 +25,17 @@ class Event:
     sold_out: bool = False
     # Populated by DB layer after insert
     id: Optional[int] = field(default=None, repr=False)
+
+
+class EventRow(NamedTuple):
+    """Read-only event row joined with its venue, as stored (dates/times are ISO text)."""
+    id: int
+    venue_key: str
+    title: str
+    date: str
+    time: str | None
+    url: str
+    price: str | None
+    sold_out: int
+    venue_name: str
+    venue_url: str | None
@@ -0,0 +1,69 @@
+"""
+Date and time helpers shared by the HTML scrapers.
+
+Venue listings print dates in a few fixed shapes ("Saturday 21st February",
+"Sat21Feb") without a year, and times as "7pm" or "19:30", so precompiled
+regexes plus a month lookup are all that's needed — dateutil's generic
+parser is far slower per call.
+"""
+
+import re
+from datetime import date, time, timedelta
+
+# Keyed on the first three letters of the (lower-cased) month name
+MONTH_MAP = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# "21st february", "21 feb", "21feb" -> ("21", "february")
+DAY_MONTH_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s*([a-z]{3,})")
+# "february 21st", "feb 21" -> ("february", "21")
+MONTH_DAY_RE = re.compile(r"([a-z]{3,})\s*(\d{1,2})(?:st|nd|rd|th)?\b")
+# Day-first numeric dates: "21/02/2026", "21.02.26", "21-02" -> ("21", "02", "2026")
+NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})[/.-](\d{1,2})(?:[/.-](\d{2}|\d{4}))?\b")
+
+
+# "7pm", "7:30 PM", "19:30", "7.30pm"; only the start is anchored, so a
+# range or suffix after the time ("19:00-23:00", "7pm - 11pm") is ignored
+TIME_RE = re.compile(r"^(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)?(?![\w:.])", re.IGNORECASE)
+
+# Dates further in the past than this are assumed to be next year's
+ROLLOVER_DAYS = 60
+
+
+def rollover_cutoff(today: date) -> date:
+    """Return the earliest date infer_year keeps in the current year."""
+    return today - timedelta(days=ROLLOVER_DAYS)
+
+
+def infer_year(day: int, month: int, current_year: int, cutoff: date) -> date:
+    """
+    Build a date in current_year, rolling to next year if it falls before
+    cutoff (see rollover_cutoff; handles listings that span New Year).
+
+    Raises ValueError for impossible dates (e.g. 30 Feb).
+    """
+    candidate = date(current_year, month, day)
+    if candidate < cutoff:
+        candidate = date(current_year + 1, month, day)
+    return candidate
+
+
+def parse_time(text: str) -> time | None:
+    """Parse a clock time like "7pm" or "19:30" (the start of a range); None if it isn't one."""
+    m = TIME_RE.match(text.strip())
+    if not m:
+        return None
+    hour, minute = int(m.group(1)), int(m.group(2) or 0)
+    meridiem = (m.group(3) or "").lower()
+    if meridiem and not 1 <= hour <= 12:
+        return None
+    if meridiem == "pm" and hour != 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+    try:
+        return time(hour, minute)
+    except ValueError:
+        return None
@@ -0,0 +1,157 @@
+"""
+HTTP session shared by every scraper.
+
+Responses are cached on disk (SQLite) for an hour, so re-running a scrape
+shortly after the last one is served mostly from the cache. Once an entry
+expires it is revalidated with If-None-Match / If-Modified-Since where the
+server sent validators, and a 304 refreshes it without re-downloading the
+body. If a venue's site is down the last cached copy is used instead.
+
+Requests that do reach the network are throttled per host: at most
+MAX_PER_HOST in flight, each preceded by a short random delay, so fanning
+out detail pages doesn't hammer a single venue's site. Hosts that publish a
+request-rate limit (HOST_RATE_LIMITS) are also kept under it.
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+# Max concurrent requests a scraper should fan out to (detail pages etc.)
+MAX_WORKERS = 16
+# Max concurrent network requests to any one host, across all scrapers
+MAX_PER_HOST = 4
+MAX_STAGGER = 0.1  # seconds
+# Hosts with a published request-rate limit: max requests per second, across
+# all scrapers. The Ticketmaster Discovery API allows 5/s and all seven
+# Ticketmaster-backed venues are scraped in parallel; 4/s leaves headroom.
+HOST_RATE_LIMITS = {"app.ticketmaster.com": 4}
+
+# Default cache location; `cv scrape` moves it next to the configured database
+# with set_cache_path(). The backend appends ".sqlite".
+CACHE_PATH = Path("data/http_cache")
+CACHE_TTL = 3600  # seconds
+
+
+
+class _Retry(Retry):
+    """Retry that also backs off before the first retry (urllib3 sends it at once)."""
+
+    def get_backoff_time(self) -> float:
+        return max(super().get_backoff_time(), self.backoff_factor)
+
+
+# Connection errors, gateway errors and rate limiting (429) are retried
+# twice, after 0.3 s and 0.6 s, or after Retry-After when the server sends
+# one. After that the last response is returned as-is so the scraper's
+# raise_for_status() reports it.
+_RETRY = _Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
+
+_host_slots: defaultdict[str, threading.BoundedSemaphore] = defaultdict(
+    lambda: threading.BoundedSemaphore(MAX_PER_HOST)
+)
+_host_slots_lock = threading.Lock()
+
+
+class _RateLimiter:
+    """Spaces calls to wait() at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        time.sleep(start - now)
+
+
+_rate_limiters = {host: _RateLimiter(rate) for host, rate in HOST_RATE_LIMITS.items()}
+
+
+class _PoliteAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that limits concurrency per host and staggers requests, and
+    keeps hosts in HOST_RATE_LIMITS under their request rate. Cache hits are
+    answered by CachedSession before reaching the adapter, so only real
+    network requests are throttled.
+
+    HTTPAdapter.send returns once the headers arrive; the body is read here,
+    while the host slot is still held, so a slow download counts against the
+    limit. Streaming requests are only throttled until their headers arrive.
+    """
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        with _host_slots_lock:
+            slot = _host_slots[host]
+        with slot:
+            time.sleep(random.uniform(0, MAX_STAGGER))
+            if (limiter := _rate_limiters.get(host)) is not None:
+                limiter.wait()
+            response = super().send(request, **kwargs)
+            if not kwargs.get("stream"):
+                response.content  # read the body while holding the slot
+            return response
+
+
+_session: CachedSession | None = None
+_session_lock = threading.Lock()
+_cache_path = CACHE_PATH
+
+
+def set_cache_path(path: Path) -> None:
+    """Store the HTTP cache at `path` (plus ".sqlite"); must precede get_session()."""
+    global _cache_path
+    with _session_lock:
+        if _session is not None and path != _cache_path:
+            raise RuntimeError("the HTTP session has already been created")
+        _cache_path = path
+
+
+def get_session() -> CachedSession:
+    """
+    Return the session shared by every scraper, creating it on first use.
+
+    Building a CachedSession opens (and creates) its SQLite cache file, so
+    this is deferred until something actually fetches; importing the CLI for
+    `cv serve` or `cv generate` leaves the working directory untouched.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session(str(_cache_path), backend="sqlite")
+        return _session
+
+
+def _build_session(cache_name: str, backend: str) -> CachedSession:
+    session = CachedSession(
+        cache_name,
+        backend=backend,
+        expire_after=CACHE_TTL,
+        stale_if_error=True,
+        # Keep API keys out of cache keys and the stored request URLs
+        ignored_parameters=["apikey"],
+    )
+    session.headers.update({"User-Agent": "concertvenues-bot/0.1"})
+    # Keep-alive connections (and their TLS sessions) are reused across
+    # requests, detail pages and venues. The per-host pool is sized for every
+    # worker so a returned connection is never discarded as surplus.
+    session.mount("https://", _PoliteAdapter(pool_maxsize=MAX_WORKERS, max_retries=_RETRY))
+    session.mount("http://", _PoliteAdapter(pool_maxsize=MAX_WORKERS, max_retries=_RETRY))
+    return session
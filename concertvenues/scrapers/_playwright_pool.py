@@ -0,0 +1,45 @@
+"""
+One headless Chromium shared by every browser-driven scraper in a process.
+
+The browser is launched on the first get_browser() call and reused after
+that, so a run with several uses_browser scrapers pays the Chromium start-up
+cost once. Playwright's sync API is bound to the thread that started it, so
+get_browser(), the pages opened on it and close_browser() must all be used
+from one thread (the main thread in `cv scrape`).
+"""
+
+import atexit
+
+_playwright = None
+_browser = None
+
+
+def get_browser():
+    """Return the shared Playwright Browser, launching it on first use."""
+    global _playwright, _browser
+    if _browser is None:
+        from playwright.sync_api import sync_playwright
+
+        playwright = sync_playwright().start()
+        try:
+            _browser = playwright.chromium.launch(headless=True)
+        except Exception:
+            playwright.stop()
+            raise
+        _playwright = playwright
+    return _browser
+
+
+def close_browser() -> None:
+    """Close the shared browser and stop Playwright, if they were started."""
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+# Safety net for callers that never close it explicitly
+atexit.register(close_browser)
@@ -0,0 +1,17 @@
+"""XPath helpers shared by the lxml-based scrapers."""
+
+from lxml import etree
+
+
+def has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def text_xpath(path: str) -> etree.XPath:
+    """
+    Compile an XPath returning the text of the first node matching `path`
+    (unstripped), or "" if nothing matches. Returns plain str rather than
+    lxml "smart" strings, which keep a reference back to their element.
+    """
+    return etree.XPath(f"string({path})", smart_strings=False)
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+import requests
 
 from concertvenues.models import Event
 
+# Re-exported so scrapers can import everything they need from base
+from concertvenues.scrapers._http import MAX_WORKERS, get_session  # noqa: F401
+
 
 class BaseScraper(ABC):
     # Subclasses must set these class attributes
     venue_key: str = ""
     venue_name: str = ""
+    # Set to True if fetch_events() drives a Playwright browser; such scrapers
+    # use the process-wide one from _playwright_pool.get_browser()
+    uses_browser: bool = False
 
     def __init__(self, venue_cfg: dict):
         """
@@ -17,7 +26,18 @@ class BaseScraper(ABC):
         self.venue_cfg = venue_cfg
         self.url = venue_cfg.get("url", "")
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all scrapers (cached, see _http.py)."""
+        return get_session()
+
     @abstractmethod
-    def fetch_events(self) -> list[Event]:
-        """Fetch and return a list of upcoming Event objects for this venue."""
+    def fetch_events(self) -> Iterable[Event]:
+        """
+        Fetch upcoming Event objects for this venue.
+
+        May return a list or be a generator; yielding lets the DB layer write
+        events in chunks as they are parsed. Order does not matter — the
+        database sorts on read.
+        """
         ...
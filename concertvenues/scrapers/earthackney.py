@@ -1,49 +1,54 @@
-import re
-from datetime import date, datetime, timezone
+from collections.abc import Iterator
+from datetime import date, datetime, time
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from concertvenues.models import Event
+from concertvenues.scrapers._xpath import has_class
 from concertvenues.scrapers.base import BaseScraper
 
+# Compiled once; lxml evaluates these in C without building a BeautifulSoup tree
+_ITEMS = etree.XPath(f"//li[{has_class('list--events__item')}]")
+_TITLE = etree.XPath(f".//*[{has_class('list--events__item__title')}]")
+_LINK = etree.XPath(f".//*[{has_class('list--events__item__image')}]//a")
+_START_DATE = etree.XPath(".//time[@itemprop='startDate']")
+_TIME = etree.XPath(f".//time[{has_class('time')}]")
+_TICKET_NOTE = etree.XPath(f".//*[{has_class('ticket-note')}]")
+_IMAGE = etree.XPath(f".//img[{has_class('event-image')}]")
+
 
 class EarthAckneyScraper(BaseScraper):
     venue_key = "earthackney"
     venue_name = "EartH Hackney"
 
-    def fetch_events(self) -> list[Event]:
-        response = requests.get(
-            self.url,
-            timeout=15,
-            headers={"User-Agent": "concertvenues-bot/0.1"},
-        )
+    def fetch_events(self) -> Iterator[Event]:
+        response = self.session.get(self.url, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = lxml_html.fromstring(response.text)
 
-        events: list[Event] = []
         today = date.today()
 
-        for item in soup.select("li.list--events__item"):
+        for item in _ITEMS(tree):
             # --- Title ---
-            title_el = item.select_one(".list--events__item__title")
-            if not title_el:
+            title_els = _TITLE(item)
+            if not title_els:
                 continue
-            title = title_el.get_text(strip=True)
+            title = title_els[0].text_content().strip()
 
             # --- URL ---
-            link_el = item.select_one(".list--events__item__image a")
-            if not link_el:
+            link_els = _LINK(item)
+            if not link_els or not link_els[0].get("href"):
                 continue
-            event_url = link_el["href"]
+            event_url = link_els[0].get("href")
 
             # --- Date & Time ---
             # <time itemprop="startDate" datetime="2026-02-27T00:00:00+00:00">
-            date_el = item.select_one("time[itemprop=startDate]")
-            if not date_el or not date_el.get("datetime"):
+            date_els = _START_DATE(item)
+            if not date_els or not date_els[0].get("datetime"):
                 continue
             try:
-                dt = datetime.fromisoformat(date_el["datetime"])
+                dt = datetime.fromisoformat(date_els[0].get("datetime"))
                 event_date = dt.date()
             except ValueError:
                 continue
@@ -53,35 +58,34 @@ class EarthAckneyScraper(BaseScraper):
 
             # Start time from <time class="time">19:00\n - 23:00</time>
             event_time = None
-            time_el = item.select_one("time.time")
-            if time_el:
-                time_text = time_el.get_text(strip=True)
+            time_els = _TIME(item)
+            if time_els:
+                time_text = time_els[0].text_content().strip()
                 # "19:00 - 23:00" or "19:00\n - 23:00" — take the first part
                 start_str = time_text.split("-")[0].strip()
                 try:
-                    from datetime import time as dt_time
                     h, m = start_str.split(":")
-                    event_time = dt_time(int(h), int(m))
+                    event_time = time(int(h), int(m))
                 except Exception:
                     pass
 
             # --- Sold out & Price ---
-            ticket_el = item.select_one(".ticket-note")
+            ticket_els = _TICKET_NOTE(item)
             sold_out = False
             price = None
-            if ticket_el:
-                ticket_text = ticket_el.get_text(strip=True)
+            if ticket_els:
+                ticket_text = ticket_els[0].text_content().strip()
                 sold_out = "sold out" in ticket_text.lower()
                 # Price is not shown on listing page for Earth; skip for now
                 # (individual event pages would be needed)
 
             # --- Image ---
             image_url = None
-            img_el = item.select_one("img.event-image")
-            if img_el and img_el.get("src"):
-                image_url = img_el["src"]
+            img_els = _IMAGE(item)
+            if img_els and img_els[0].get("src"):
+                image_url = img_els[0].get("src")
 
-            events.append(Event(
+            yield Event(
                 venue_key=self.venue_key,
                 title=title,
                 date=event_date,
@@ -90,6 +94,4 @@ class EarthAckneyScraper(BaseScraper):
                 sold_out=sold_out,
                 price=price,
                 image_url=image_url,
-            ))
-
-        return events
+            )
@@ -1,90 +1,102 @@
+import logging
 import re
-from datetime import date, time
+from collections.abc import Iterator
+from datetime import date
 
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from lxml import etree
+from lxml import html as lxml_html
 
 from concertvenues.models import Event
+from concertvenues.scrapers._dateutils import (
+    DAY_MONTH_RE,
+    MONTH_DAY_RE,
+    MONTH_MAP,
+    NUMERIC_DATE_RE,
+    infer_year,
+    parse_time,
+    rollover_cutoff,
+)
+from concertvenues.scrapers._xpath import has_class, text_xpath
 from concertvenues.scrapers.base import BaseScraper
 
+logger = logging.getLogger(__name__)
+
 _SOLD_OUT_RE = re.compile(r"sold.?out", re.IGNORECASE)
 # Matches "SOLD OUT!" / "– SOLD OUT!" appended to event names
 _TITLE_SUFFIX_RE = re.compile(r"\s*[–-]?\s*sold.?out!?\s*$", re.IGNORECASE)
+# background-image URL in the .grid-image style attribute
+_IMG_URL_RE = re.compile(r"url\(['\"]?(.+?)['\"]?\)")
+
+_CARDS = etree.XPath(f"//div[{has_class('grid-block')}]")
+# Per-card lookups return plain strings / booleans straight from libxml2,
+# so no element proxies are built for the fields
+_LINK_HREF = text_xpath(f".//a[{has_class('grid-link')}]/@href")
+_NAME_TEXT = text_xpath(f".//*[{has_class('event-name')}]//a")
+_HAS_BUY_BUTTON = etree.XPath(
+    f"boolean(.//*[{has_class('buy-share-event')}]//*[{has_class('button')}])"
+)
+_DATE_TEXT = text_xpath(f".//*[{has_class('event-date')}]")
+_TIME_TEXT = text_xpath(f".//*[{has_class('event-time')}]")
+_PRICE_TEXT = text_xpath(f".//*[{has_class('event-price')}]")
+_IMAGE_STYLE = text_xpath(f".//*[{has_class('grid-image')}]/@style")
 
 
 class ElectricBallroomScraper(BaseScraper):
     venue_key = "electricballroom"
     venue_name = "Electric Ballroom"
 
-    def fetch_events(self) -> list[Event]:
-        response = requests.get(
-            self.url,
-            timeout=15,
-            headers={"User-Agent": "concertvenues-bot/0.1"},
-        )
+    def fetch_events(self) -> Iterator[Event]:
+        response = self.session.get(self.url, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = lxml_html.fromstring(response.text)
 
-        events: list[Event] = []
         today = date.today()
+        current_year, cutoff = today.year, rollover_cutoff(today)
+
+        for card in _CARDS(tree):
+            # --- Date ---
+            # Checked first so past and undated cards are dropped before any
+            # other lookups
+            date_text = _DATE_TEXT(card).strip()
+            try:
+                event_date = _parse_date(date_text, current_year, cutoff)
+            except ValueError:
+                # skip cards with missing or unparseable dates
+                logger.debug("Skipping card with unparseable date %r", date_text)
+                continue
+
+            if event_date < today:
+                continue  # skip past events
 
-        for card in soup.select(".grid-block"):
             # --- URL ---
-            link_el = card.select_one("a.grid-link")
-            if not link_el:
+            event_url = _LINK_HREF(card)
+            if not event_url:
                 continue
-            event_url = link_el["href"]
 
             # --- Title ---
-            name_el = card.select_one(".event-name a")
-            if not name_el:
+            raw_title = _NAME_TEXT(card).strip()
+            if not raw_title:
                 continue
-            raw_title = name_el.get_text(strip=True)
 
             # Detect sold-out from title text before stripping the suffix
             sold_out = bool(_SOLD_OUT_RE.search(raw_title))
             # Also treat missing buy-button as sold out (Crowbar-style)
-            if not sold_out and not card.select_one(".buy-share-event .button"):
+            if not sold_out and not _HAS_BUY_BUTTON(card):
                 sold_out = True
 
             title = _TITLE_SUFFIX_RE.sub("", raw_title).strip()
 
-            # --- Date ---
-            date_el = card.select_one(".event-date")
-            if not date_el:
-                continue
-            date_str = date_el.get_text(strip=True)
-            try:
-                event_date = _parse_date(date_str, today)
-            except Exception:
-                continue  # skip cards with unparseable dates
-
-            if event_date < today:
-                continue  # skip past events
-
             # --- Time ---
-            time_el = card.select_one(".event-time")
-            event_time = None
-            if time_el:
-                try:
-                    event_time = dateparser.parse(time_el.get_text(strip=True)).time()
-                except Exception:
-                    pass
+            event_time = parse_time(_TIME_TEXT(card))
 
             # --- Price ---
-            price_el = card.select_one(".event-price")
-            price = price_el.get_text(strip=True) if price_el else None
+            price = _PRICE_TEXT(card).strip() or None
 
             # --- Image ---
-            image_el = card.select_one(".grid-image")
-            image_url = None
-            if image_el and image_el.get("style"):
-                m = re.search(r"url\(['\"]?(.+?)['\"]?\)", image_el["style"])
-                if m:
-                    image_url = m.group(1)
-
-            events.append(Event(
+            m = _IMG_URL_RE.search(_IMAGE_STYLE(card))
+            image_url = m.group(1) if m else None
+
+            yield Event(
                 venue_key=self.venue_key,
                 title=title,
                 date=event_date,
@@ -93,21 +105,30 @@ class ElectricBallroomScraper(BaseScraper):
                 price=price,
                 sold_out=sold_out,
                 image_url=image_url,
-            ))
+            )
 
-        return events
 
-
-def _parse_date(date_str: str, reference: date) -> date:
+def _parse_date(date_str: str, current_year: int, cutoff: date) -> date:
     """
-    Parse a human-readable date like "Saturday 21st February" into a date object.
-    Infers the year: uses the current year, but rolls to next year if the
-    parsed date is more than 60 days in the past (handles end-of-year edge cases).
+    Parse a human-readable date like "Saturday 21st February", "February 21st"
+    or "21/02/2026" (day first) into a date object.
+    Unless a four-digit year is given, infers the year: uses the current year,
+    but rolls to next year if the parsed date is before cutoff (handles
+    end-of-year edge cases).
+
+    Raises ValueError if no date can be read from date_str.
     """
-    parsed = dateparser.parse(date_str, dayfirst=True)
-    if parsed is None:
+    text = date_str.lower()
+    for regex, day_group, month_group in ((DAY_MONTH_RE, 1, 2), (MONTH_DAY_RE, 2, 1)):
+        m = regex.search(text)
+        month = MONTH_MAP.get(m.group(month_group)[:3]) if m else None
+        if month:
+            return infer_year(int(m.group(day_group)), month, current_year, cutoff)
+
+    m = NUMERIC_DATE_RE.search(text)
+    if not m:
         raise ValueError(f"Cannot parse date: {date_str!r}")
-    candidate = parsed.replace(year=reference.year).date()
-    if (reference - candidate).days > 60:
-        candidate = candidate.replace(year=reference.year + 1)
-    return candidate
+    day, month, year = int(m.group(1)), int(m.group(2)), m.group(3)
+    if year and len(year) == 4:
+        return date(int(year), month, day)
+    return infer_year(day, month, current_year, cutoff)
@@ -1,19 +1,30 @@
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, time
-from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from concertvenues.models import Event
-from concertvenues.scrapers.base import BaseScraper
+from concertvenues.scrapers._dateutils import MONTH_MAP, infer_year, rollover_cutoff
+from concertvenues.scrapers.base import MAX_WORKERS, BaseScraper
 
-_MONTH_MAP = {
-    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-}
+_PRICE_RE = re.compile(r"£([\d.]+)")
+# Leading day-of-week abbreviation in "Sat21Feb"
+_WEEKDAY_RE = re.compile(r"^[A-Za-z]{3}")
+_DATE_RE = re.compile(r"(\d{1,2})\s*([A-Za-z]{3})")
+
+# CSS selectors compiled once rather than re-parsed on every select_one()
+_TITLE_SEL = sv.compile(".event-title")
+_HOST_SEL = sv.compile(".host")
+_LINK_SEL = sv.compile("a[href]")
+_PRICE_SEL = sv.compile(".price")
+_SOLD_OUT_SEL = sv.compile(".sold-out-div")
+_DETAILS_SEL = sv.compile(".details-grid")
+
+# Detail pages: only the blocks _fetch_event_detail reads are parsed
+_DETAIL_STRAINER = SoupStrainer(class_=["price", "sold-out-div", "details-grid"])
 
 
 class JazzCafeScraper(BaseScraper):
@@ -21,56 +32,50 @@ class JazzCafeScraper(BaseScraper):
     venue_name = "Jazz Cafe"
 
     def fetch_events(self) -> list[Event]:
-        session = requests.Session()
-        session.headers.update({"User-Agent": "concertvenues-bot/0.1"})
-
-        response = session.get(self.url, timeout=15)
+        response = self.session.get(self.url, timeout=15)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "lxml")
 
         today = date.today()
-        stubs: list[dict] = []
-
-        # Each event block is structured as date_div.parent.parent
-        date_divs = soup.find_all(class_="event-date")
-        for date_div in date_divs:
-            block = date_div.parent.parent
-
-            title_el = block.select_one(".event-title")
-            if not title_el:
-                continue
-
-            # Title: has a <span class="host"> (subtitle) and a main text node
-            # We want just the band/act name, not the host/subtitle
-            host_el = title_el.select_one(".host")
-            if host_el:
-                host_el.extract()
-            title = title_el.get_text(separator=" ", strip=True).strip()
-
-            link_el = block.select_one("a[href]")
-            if not link_el:
-                continue
-            event_url = link_el["href"]
-
-            # Parse date: "Sat21Feb" -> date
-            date_text = date_div.get_text(strip=True)
-            event_date = _parse_date(date_text, today)
-            if event_date is None or event_date < today:
-                continue
-
-            stubs.append({
-                "title": title,
-                "url": event_url,
-                "date": event_date,
-            })
-
-        # Fetch each event page for price + sold-out + time (parallelised)
+        current_year, cutoff = today.year, rollover_cutoff(today)
         events: list[Event] = []
-        with ThreadPoolExecutor(max_workers=8) as pool:
-            futures = {
-                pool.submit(_fetch_event_detail, session, stub): stub
-                for stub in stubs
-            }
+
+        # Each event page is fetched for price + sold-out + time. Fetches are
+        # submitted as the listing is walked, so they overlap with parsing it.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures: dict = {}
+
+            # Each event block is structured as date_div.parent.parent
+            date_divs = soup.find_all(class_="event-date")
+            for date_div in date_divs:
+                block = date_div.parent.parent
+
+                title_el = _TITLE_SEL.select_one(block)
+                if not title_el:
+                    continue
+
+                # Title: has a <span class="host"> (subtitle) and a main text node
+                # We want just the band/act name, not the host/subtitle
+                title = _text_excluding(title_el, _HOST_SEL.select_one(title_el))
+
+                link_el = _LINK_SEL.select_one(block)
+                if not link_el:
+                    continue
+                event_url = link_el["href"]
+
+                # Parse date: "Sat21Feb" -> date
+                date_text = date_div.get_text(strip=True)
+                event_date = _parse_date(date_text, current_year, cutoff)
+                if event_date is None or event_date < today:
+                    continue
+
+                stub = {
+                    "title": title,
+                    "url": event_url,
+                    "date": event_date,
+                }
+                futures[pool.submit(_fetch_event_detail, self.session, stub)] = stub
+
             for future in as_completed(futures):
                 stub = futures[future]
                 try:
@@ -87,41 +92,37 @@ class JazzCafeScraper(BaseScraper):
                     sold_out=detail.get("sold_out", False),
                 ))
 
-        events.sort(key=lambda e: (e.date, e.time or time.min))
         return events
 
 
 def _fetch_event_detail(session: requests.Session, stub: dict) -> dict:
     r = session.get(stub["url"], timeout=15)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "lxml")
+    soup = BeautifulSoup(r.text, "lxml", parse_only=_DETAIL_STRAINER)
 
     result: dict = {}
 
     # --- Price ---
     # <div class="price"><h2>Price</h2><strong>Standing Tickets: £25</strong> ...
-    price_el = soup.select_one(".price")
+    price_el = _PRICE_SEL.select_one(soup)
     if price_el:
-        # Remove the "Price" heading
-        h = price_el.find(["h1", "h2", "h3"])
-        if h:
-            h.extract()
-        price_text = price_el.get_text(" ", strip=True)
+        # Skip the "Price" heading
+        price_text = _text_excluding(price_el, price_el.find(["h1", "h2", "h3"]))
         # Extract lowest £ amount
-        amounts = re.findall(r"£([\d.]+)", price_text)
+        amounts = _PRICE_RE.findall(price_text)
         if amounts:
             min_price = min(float(a) for a in amounts)
             result["price"] = f"From £{min_price:.0f}" if len(amounts) > 1 else f"£{min_price:.0f}"
 
     # --- Sold out ---
     # .sold-out-div is present on all pages but empty when not sold out
-    sold_div = soup.select_one(".sold-out-div")
+    sold_div = _SOLD_OUT_SEL.select_one(soup)
     if sold_div and sold_div.get_text(strip=True):
         result["sold_out"] = True
 
     # --- Time ---
     # <div class="details-grid"> contains a div with <h2>Doors</h2><p ...>19:00-22:30</p>
-    details = soup.select_one(".details-grid")
+    details = _DETAILS_SEL.select_one(soup)
     if details:
         for div in details.find_all("div", recursive=False):
             h = div.find(["h2", "h3"])
@@ -139,23 +140,28 @@ def _fetch_event_detail(session: requests.Session, stub: dict) -> dict:
     return result
 
 
-def _parse_date(date_text: str, reference: date) -> Optional[date]:
+def _text_excluding(el: Tag, skip: Tag | None) -> str:
+    """
+    Like el.get_text(" ", strip=True), leaving out the text inside `skip`.
+    Avoids extract(), which would mutate the parsed tree for every card.
+    """
+    skip_ids = {id(s) for s in skip.strings} if skip is not None else set()
+    return " ".join(t for s in el.strings if id(s) not in skip_ids and (t := s.strip()))
+
+
+def _parse_date(date_text: str, current_year: int, cutoff: date) -> date | None:
     """Parse 'Sat21Feb' or 'Sat 21 Feb' into a date, inferring year."""
     # Strip day-of-week (first 3 letters if alpha)
-    text = re.sub(r"^[A-Za-z]{3}", "", date_text).strip()
+    text = _WEEKDAY_RE.sub("", date_text).strip()
     # Now should be like "21Feb" or "21 Feb"
-    m = re.match(r"(\d{1,2})\s*([A-Za-z]{3})", text)
+    m = _DATE_RE.match(text)
     if not m:
         return None
     day = int(m.group(1))
-    month = _MONTH_MAP.get(m.group(2).lower())
+    month = MONTH_MAP.get(m.group(2).lower())
     if not month:
         return None
-    year = reference.year
     try:
-        candidate = date(year, month, day)
+        return infer_year(day, month, current_year, cutoff)
     except ValueError:
         return None
-    if (reference - candidate).days > 60:
-        candidate = date(year + 1, month, day)
-    return candidate
@@ -4,6 +4,9 @@ O2 Academy Brixton & O2 Forum Kentish Town scrapers.
 Both venues are on the Academy Music Group platform which exposes a JSON API:
   https://www.academymusicgroup.com/api/search/events?VenueIds=<ID>&PageSize=200
 
+A full page (PageSize documents) means there may be more, so further pages
+are requested with &Page=<N>, up to _MAX_PAGES requests in total.
+
 Venue IDs:
   - O2 Academy Brixton:      3919
   - O2 Forum Kentish Town:   5597
@@ -23,17 +26,21 @@ Event URL pattern:
 """
 
 import re
+from collections.abc import Iterator
 from datetime import date, datetime, time
 from typing import Optional
 
-import requests
+import orjson
 
 from concertvenues.models import Event
-from concertvenues.scrapers.base import BaseScraper
+from concertvenues.scrapers.base import BaseScraper, get_session
 
 _BASE = "https://www.academymusicgroup.com"
 _API = "https://www.academymusicgroup.com/api/search/events"
 _HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
+_DOOR_TIME_RE = re.compile(r"^\d{1,2}:\d{2}$")
+_PAGE_SIZE = 200
+_MAX_PAGES = 5
 
 _VENUE_IDS = {
     "o2academybrixton": 3919,
@@ -45,28 +52,49 @@ _VENUE_SLUGS = {
 }
 
 
+def _fetch_amg_documents(venue_id: int) -> Iterator[dict]:
+    """Yield every event document for a venue, following pages while they are full."""
+    first_docs: list[dict] = []
+    # The first request sends no Page; whether the API counts pages from 0 or
+    # 1 is unknown, so follow-ups start at Page=1 and skip a repeat of it
+    for page in (None, *range(1, _MAX_PAGES)):
+        params = {"VenueIds": venue_id, "PageSize": _PAGE_SIZE}
+        if page is not None:
+            params["Page"] = page
+        r = get_session().get(_API, params=params, headers=_HEADERS, timeout=20)
+        r.raise_for_status()
+        # orjson parses the raw bytes directly; r.json() decodes to str first
+        docs = orjson.loads(r.content).get("documents", [])
+        if not docs:
+            return
+        if docs[0] in first_docs:
+            # Page=1 may just repeat the first page (1-based paging); any
+            # other repeat means the API ignores Page, so stop there
+            if page == 1:
+                continue
+            return
+        first_docs.append(docs[0])
+        yield from docs
+        if len(docs) < _PAGE_SIZE:
+            return
+
+
 def _scrape_amg_venue(venue_key: str) -> list[Event]:
     venue_id = _VENUE_IDS[venue_key]
     venue_slug = _VENUE_SLUGS[venue_key]
     today = date.today()
 
-    r = requests.get(
-        _API,
-        params={"VenueIds": venue_id, "PageSize": 200},
-        headers=_HEADERS,
-        timeout=20,
-    )
-    r.raise_for_status()
-    docs = r.json().get("documents", [])
+    docs = _fetch_amg_documents(venue_id)
 
     events: list[Event] = []
     seen: set[tuple[str, date]] = set()
+    seen_add = seen.add  # bound once; called per document
 
     for doc in docs:
-        # Date
+        # Date ("2026-03-01T00:00:00Z"; fromisoformat accepts the Z on 3.11+)
         raw_date = doc.get("eventDate", "")
         try:
-            event_date = datetime.fromisoformat(raw_date.replace("Z", "+00:00")).date()
+            event_date = datetime.fromisoformat(raw_date).date()
         except (ValueError, TypeError):
             continue
         if event_date < today:
@@ -80,7 +108,7 @@ def _scrape_amg_venue(venue_key: str) -> list[Event]:
         # Time (door time)
         door = doc.get("doorTime", "") or ""
         event_time: Optional[time] = None
-        if re.match(r"^\d{1,2}:\d{2}$", door):
+        if _DOOR_TIME_RE.match(door):
             try:
                 event_time = time.fromisoformat(door)
             except ValueError:
@@ -102,7 +130,7 @@ def _scrape_amg_venue(venue_key: str) -> list[Event]:
         key = (event_url, event_date)
         if key in seen:
             continue
-        seen.add(key)
+        seen_add(key)
 
         events.append(Event(
             venue_key=venue_key,
@@ -113,7 +141,6 @@ def _scrape_amg_venue(venue_key: str) -> list[Event]:
             sold_out=sold_out,
         ))
 
-    events.sort(key=lambda e: (e.date, e.time or time.min))
     return events
 
 
@@ -16,159 +16,228 @@ We use Playwright to load the listing (clicking Load More until exhausted),
 then fetch each detail page concurrently via requests for JSON-LD data.
 """
 
-import json
+import logging
+import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, time
+from itertools import chain
 from typing import Optional
 
-import requests
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
 
 from concertvenues.models import Event
-from concertvenues.scrapers.base import BaseScraper
+from concertvenues.scrapers._playwright_pool import get_browser
+from concertvenues.scrapers.base import MAX_WORKERS, BaseScraper, get_session
+
+logger = logging.getLogger(__name__)
 
 _BASE = "https://www.theo2.co.uk"
 _HEADERS = {"User-Agent": "concertvenues-bot/0.1"}
-
-
-def _fetch(url: str) -> Optional[BeautifulSoup]:
+_DETAIL_LINKS = etree.XPath("//a[contains(@href, '/events/detail/')]")
+
+# Listing requests that never affect the rendered event links. Stylesheets
+# are kept: the cookie banner and Load More button are found via is_visible().
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "facebook.net",
+)
+# Detail pages are only read for their JSON-LD blocks, so those are cut
+# straight out of the raw bytes instead of parsing the HTML
+_JSON_LD_RE = re.compile(
+    rb"""<script[^>]*type=["']?application/ld\+json["']?[^>]*>(.*?)</script>""",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _fetch(url: str) -> Optional[bytes]:
     try:
-        r = requests.get(url, headers=_HEADERS, timeout=15)
+        r = get_session().get(url, headers=_HEADERS, timeout=15)
         r.raise_for_status()
-        return BeautifulSoup(r.text, "lxml")
+        return r.content
     except Exception:
         return None
 
 
 def _parse_detail(url: str, today: date) -> Optional[dict]:
     """Fetch a detail page and extract fields from its MusicEvent JSON-LD block."""
-    soup = _fetch(url)
-    if not soup:
+    body = _fetch(url)
+    if not body:
         return None
 
-    for script in soup.find_all("script", type="application/ld+json"):
+    for m in _JSON_LD_RE.finditer(body):
+        block = m.group(1)
+        # Pages also carry Organization / BreadcrumbList / ... blocks; skip
+        # any that can't contain an Event without decoding them
+        if b'Event"' not in block:
+            continue
         try:
-            data = json.loads(script.string or "")
-        except (json.JSONDecodeError, TypeError):
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
             continue
 
-        if not isinstance(data, dict):
-            continue
-        if data.get("@type") not in ("MusicEvent", "Event"):
-            continue
+        for node in _json_ld_nodes(data):
+            if node.get("@type") not in ("MusicEvent", "Event"):
+                continue
 
-        start_raw = data.get("startDate", "")
-        try:
-            start_dt = datetime.fromisoformat(start_raw)
-            event_date = start_dt.date()
-            event_time: Optional[time] = start_dt.time() if (start_dt.hour or start_dt.minute) else None
-        except (ValueError, TypeError):
-            continue
+            start_raw = node.get("startDate", "")
+            try:
+                start_dt = datetime.fromisoformat(start_raw)
+                event_date = start_dt.date()
+                has_time = start_dt.hour or start_dt.minute
+                event_time: Optional[time] = start_dt.time() if has_time else None
+            except (ValueError, TypeError):
+                continue
 
-        if event_date < today:
-            return None
+            if event_date < today:
+                return None
 
-        status = data.get("eventStatus", "")
-        if "Cancelled" in status or "Postponed" in status:
-            return None
+            status = node.get("eventStatus", "")
+            if "Cancelled" in status or "Postponed" in status:
+                return None
 
-        offers = data.get("offers", {})
-        availability = offers.get("availability", "")
-        sold_out = "SoldOut" in availability or "soldout" in availability.lower()
+            offers = node.get("offers", {})
+            availability = offers.get("availability", "")
+            sold_out = "SoldOut" in availability or "soldout" in availability.lower()
 
-        return {
-            "date": event_date,
-            "time": event_time,
-            "sold_out": sold_out,
-        }
+            return {
+                "date": event_date,
+                "time": event_time,
+                "sold_out": sold_out,
+            }
 
     return None
 
 
+def _json_ld_nodes(data) -> list[dict]:
+    """Top-level objects of a JSON-LD block: a single object, a list, or an @graph."""
+    if isinstance(data, dict):
+        data = data.get("@graph", [data])
+    if not isinstance(data, list):
+        return []
+    return [node for node in data if isinstance(node, dict)]
+
+
+def _first_h3_within(tree) -> dict:
+    """
+    Map every element that contains an h3 to the first h3 inside it.
+    Built in one document-order pass over the h3s, so each link's title is a
+    walk up its ancestors rather than a subtree search per ancestor.
+    """
+    first_h3: dict = {}
+    for h3 in tree.iter("h3"):
+        for el in h3.iterancestors():
+            if el in first_h3:
+                break  # so are all of its ancestors, by an earlier h3
+            first_h3[el] = h3
+    return first_h3
+
+
+def _text(el) -> str:
+    """Text content of an lxml element with whitespace collapsed."""
+    return " ".join(el.text_content().split())
+
+
+# Clicks "Load More" inside the page until it goes away, waiting after each
+# click only until new event links appear (max 3 s). A click that adds
+# nothing is retried once, since a slow batch can take longer than that; a
+# second one in a row gives up, as does reaching maxClicks (a button that
+# never hides). Resolves to {clicks, buttonVisible}.
+_LOAD_ALL_JS = """
+async (maxClicks) => {
+    const count = () => document.querySelectorAll("a[href*='/events/detail/']").length;
+    const button = () => {
+        const btn = document.querySelector("button.loadMoreEvents");
+        return btn && btn.offsetParent !== null ? btn : null;
+    };
+    let clicks = 0;
+    let misses = 0;
+    while (clicks < maxClicks && misses < 2) {
+        const btn = button();
+        if (!btn) break;
+        const before = count();
+        btn.click();
+        clicks++;
+        const grew = await new Promise((resolve) => {
+            const started = Date.now();
+            const timer = setInterval(() => {
+                if (count() > before || Date.now() - started > 3000) {
+                    clearInterval(timer);
+                    resolve(count() > before);
+                }
+            }, 100);
+        });
+        misses = grew ? 0 : misses + 1;
+    }
+    return {clicks, buttonVisible: button() !== null};
+}
+"""
+_MAX_LOAD_MORE_CLICKS = 100
+
+
+def _block_unneeded(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in _BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
 class TheO2Scraper(BaseScraper):
     venue_key = "theo2"
     venue_name = "The O2"
 
-    def fetch_events(self) -> list[Event]:
-        from playwright.sync_api import sync_playwright
+    uses_browser = True
 
+    def fetch_events(self) -> list[Event]:
         today = date.today()
 
         # Use Playwright to load listing and click "Load More" until exhausted
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            try:
-                page.goto(self.url, wait_until="networkidle", timeout=60_000)
-                page.wait_for_timeout(2000)
-
-                # Dismiss OneTrust cookie consent banner if present
-                for selector in (
-                    "#onetrust-accept-btn-handler",
-                    "button#accept-recommended-btn-handler",
-                    ".onetrust-accept-btn-handler",
-                ):
-                    btn = page.query_selector(selector)
-                    if btn and btn.is_visible():
-                        btn.click()
-                        page.wait_for_timeout(1000)
-                        break
-
-                while True:
-                    btn = page.query_selector("button.loadMoreEvents")
-                    if not btn or not btn.is_visible():
-                        break
-                    btn.click()
-                    page.wait_for_timeout(1500)
-                html = page.content()
-            finally:
-                browser.close()
+        html = self._load_listing()
 
-        soup = BeautifulSoup(html, "lxml")
+        tree = lxml_html.fromstring(html)
+        headings = _first_h3_within(tree)
 
-        # Collect all unique event detail URLs
+        # Detail pages are submitted as each unique link is found, so they
+        # are fetched while the rest of the listing is still being walked
         seen: set[str] = set()
-        event_links: list[tuple[str, str]] = []  # (url, title)
-
-        for a in soup.select("a[href*='/events/detail/']"):
-            href = a.get("href", "")
-            if not href:
-                continue
-            if not href.startswith("http"):
-                href = _BASE + href
-            if href in seen:
-                continue
-            seen.add(href)
-
-            # Title: prefer h3 inside the same card, else the link text
-            heading = a.find("h3") or a.find_parent("div", recursive=False)
-            if heading and heading.name == "h3":
-                title = heading.get_text(strip=True)
-            else:
-                # Look for h3 near this link
-                card = a.find_parent(lambda tag: tag.find("h3"))
-                if card:
-                    h3 = card.find("h3")
-                    title = h3.get_text(strip=True) if h3 else ""
-                else:
-                    title = a.get_text(strip=True)
-
-            if not title:
-                slug = href.rstrip("/").split("/")[-1]
-                title = slug.replace("-", " ").title()
-
-            event_links.append((href, title))
-
-        if not event_links:
-            return []
-
-        # Fetch detail pages concurrently
+        seen_add = seen.add
         events: list[Event] = []
-        with ThreadPoolExecutor(max_workers=8) as pool:
-            future_map = {
-                pool.submit(_parse_detail, url, today): (url, title)
-                for url, title in event_links
-            }
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            future_map: dict = {}
+
+            for a in _DETAIL_LINKS(tree):
+                href = a.get("href", "")
+                if not href:
+                    continue
+                if not href.startswith("http"):
+                    href = _BASE + href
+                if href in seen:
+                    continue
+                seen_add(href)
+
+                # Title: the first h3 inside the link, else inside the nearest
+                # enclosing element that has one (the card), else the link text
+                heading = next(
+                    (headings[el] for el in chain((a,), a.iterancestors()) if el in headings),
+                    a,
+                )
+                title = _text(heading)
+
+                if not title:
+                    slug = href.rstrip("/").split("/")[-1]
+                    title = slug.replace("-", " ").title()
+
+                future_map[pool.submit(_parse_detail, href, today)] = (href, title)
+
             for future in as_completed(future_map):
                 url, title = future_map[future]
                 detail = future.result()
@@ -184,5 +253,45 @@ class TheO2Scraper(BaseScraper):
                     sold_out=detail["sold_out"],
                 ))
 
-        events.sort(key=lambda e: (e.date, e.time or time.min))
         return events
+
+    def _load_listing(self) -> str:
+        """Render the listing page in a fresh browser context and return its HTML."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+        context = get_browser().new_context()
+        context.route("**/*", _block_unneeded)
+        page = context.new_page()
+        try:
+            # Don't wait for the network to go idle (analytics keep it busy);
+            # carry on as soon as the first event links have rendered
+            page.goto(self.url, wait_until="domcontentloaded", timeout=60_000)
+            try:
+                page.wait_for_selector("a[href*='/events/detail/']", timeout=15_000)
+            except PlaywrightTimeoutError:
+                # An empty listing has no cards to wait for; it yields no events
+                logger.warning("%s: no event links rendered within 15 s", self.url)
+                return page.content()
+
+            # Dismiss OneTrust cookie consent banner if present
+            for selector in (
+                "#onetrust-accept-btn-handler",
+                "button#accept-recommended-btn-handler",
+                ".onetrust-accept-btn-handler",
+            ):
+                btn = page.query_selector(selector)
+                if btn and btn.is_visible():
+                    btn.click()
+                    page.wait_for_timeout(1000)
+                    break
+
+            result = page.evaluate(_LOAD_ALL_JS, _MAX_LOAD_MORE_CLICKS)
+            if result["buttonVisible"]:
+                logger.warning(
+                    "%s: stopped clicking Load More after %d clicks with the button "
+                    "still visible; the listing may be incomplete",
+                    self.url, result["clicks"],
+                )
+            return page.content()
+        finally:
+            context.close()
@@ -25,10 +25,15 @@ Fields used:
 """
 
 import os
-from datetime import date, datetime, time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+from itertools import chain
 from typing import Optional
 
-import requests
+import orjson
+
+from concertvenues.scrapers.base import MAX_WORKERS, get_session
 
 _API = "https://app.ticketmaster.com/discovery/v2/events.json"
 
@@ -41,73 +46,67 @@ def get_api_key(venue_cfg: dict) -> str:
     return key
 
 
-def fetch_tm_events(venue_id: str, venue_key: str, fallback_url: str, api_key: str) -> list:
+def fetch_tm_events(venue_id: str, venue_key: str, fallback_url: str, api_key: str) -> Iterator:
     """
     Fetch all upcoming events for a Ticketmaster venue ID.
 
-    Returns a list of Event-compatible dicts with keys:
-      venue_key, title, date, time, url, sold_out
+    Yields Event objects with venue_key, title, date, time, url and sold_out set.
     """
     from concertvenues.models import Event
 
     today = date.today()
-    events: list[Event] = []
-    page = 0
 
-    while True:
-        r = requests.get(
+    def fetch_page(page: int) -> dict:
+        r = get_session().get(
             _API,
             params={"venueId": venue_id, "size": 200, "page": page, "apikey": api_key},
             timeout=20,
         )
         r.raise_for_status()
-        data = r.json()
-
-        page_data = data.get("page", {})
-        docs = data.get("_embedded", {}).get("events", [])
-
-        for doc in docs:
-            status_code = doc.get("dates", {}).get("status", {}).get("code", "")
-            if status_code in ("cancelled", "postponed"):
-                continue
-
-            start = doc.get("dates", {}).get("start", {})
-            raw_date = start.get("localDate", "")
-            try:
-                event_date = datetime.strptime(raw_date, "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                continue
-            if event_date < today:
-                continue
-
-            title = doc.get("name", "").strip()
-            if not title:
-                continue
-
-            event_time: Optional[time] = None
-            if not start.get("timeTBA") and not start.get("noSpecificTime"):
-                raw_time = start.get("localTime", "")
+        return orjson.loads(r.content)
+
+    # The first page tells us how many there are; the rest are fetched in parallel
+    first = fetch_page(0)
+    total_pages = first.get("page", {}).get("totalPages", 1)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, total_pages - 1))) as pool:
+        for data in chain([first], pool.map(fetch_page, range(1, total_pages))):
+            docs = data.get("_embedded", {}).get("events", [])
+
+            for doc in docs:
+                status_code = doc.get("dates", {}).get("status", {}).get("code", "")
+                if status_code in ("cancelled", "postponed"):
+                    continue
+
+                start = doc.get("dates", {}).get("start", {})
+                raw_date = start.get("localDate", "")
                 try:
-                    event_time = time.fromisoformat(raw_time)
+                    event_date = date.fromisoformat(raw_date)
                 except (ValueError, TypeError):
-                    pass
-
-            event_url = doc.get("url", "") or fallback_url
-            sold_out = status_code == "offsale"
-
-            events.append(Event(
-                venue_key=venue_key,
-                title=title,
-                date=event_date,
-                time=event_time,
-                url=event_url,
-                sold_out=sold_out,
-            ))
-
-        total_pages = page_data.get("totalPages", 1)
-        if page + 1 >= total_pages:
-            break
-        page += 1
-
-    events.sort(key=lambda e: (e.date, e.time or time.min))
-    return events
+                    continue
+                if event_date < today:
+                    continue
+
+                title = doc.get("name", "").strip()
+                if not title:
+                    continue
+
+                event_time: Optional[time] = None
+                if not start.get("timeTBA") and not start.get("noSpecificTime"):
+                    raw_time = start.get("localTime", "")
+                    try:
+                        event_time = time.fromisoformat(raw_time)
+                    except (ValueError, TypeError):
+                        pass
+
+                event_url = doc.get("url", "") or fallback_url
+                sold_out = status_code == "offsale"
+
+                yield Event(
+                    venue_key=venue_key,
+                    title=title,
+                    date=event_date,
+                    time=event_time,
+                    url=event_url,
+                    sold_out=sold_out,
+                )
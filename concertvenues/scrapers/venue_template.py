@@ -5,7 +5,7 @@ Steps to use this template:
 1. Copy this file to <venue_key>.py  (e.g., fillmore.py)
 2. Set venue_key  — must match the [venues.<key>] section in config.toml
 3. Set venue_name — human-readable display name
-4. Implement fetch_events() to return a list of Event objects
+4. Implement fetch_events() to yield (or return a list of) Event objects
 5. Import and register the class in scrapers/__init__.py
 
 Tips:
@@ -16,10 +16,10 @@ Tips:
 - Keep the scraper stateless; fetch_events() should be safe to call multiple times
 """
 
+from collections.abc import Iterator
 from datetime import date
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 from dateutil import parser as dateparser
 
@@ -31,13 +31,12 @@ class VenueTemplateScraper(BaseScraper):
     venue_key = "venue_template"          # <-- change this
     venue_name = "Venue Template"         # <-- change this
 
-    def fetch_events(self) -> list[Event]:
-        response = requests.get(self.url, timeout=15, headers={"User-Agent": "concertvenues/0.1"})
+    def fetch_events(self) -> Iterator[Event]:
+        # self.session is shared and caches responses on disk (see _http.py)
+        response = self.session.get(self.url, timeout=15)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "lxml")
 
-        events: list[Event] = []
-
         # TODO: update the CSS selectors below to match the actual venue HTML structure
         for item in soup.select(".event-item"):
             title_el = item.select_one(".event-title")
@@ -56,11 +55,9 @@ class VenueTemplateScraper(BaseScraper):
                 base = urlparse(self.url)
                 url = f"{base.scheme}://{base.netloc}{url}"
 
-            events.append(Event(
+            yield Event(
                 venue_key=self.venue_key,
                 title=title,
                 date=event_date,
                 url=url,
-            ))
-
-        return events
+            )
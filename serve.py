@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """Serve the generated static site locally for preview."""
 
+import functools
 import http.server
-import os
-import socketserver
 import webbrowser
 from pathlib import Path
 
@@ -22,15 +21,16 @@ def main():
         print(f"'{OUTPUT_DIR}' is empty or missing. Run 'cv generate' first.")
         return
 
-    os.chdir(OUTPUT_DIR)
-
     url = f"http://localhost:{PORT}"
     print(f"Serving '{OUTPUT_DIR}/' at {url}")
     print("Press Ctrl+C to stop.\n")
     webbrowser.open(url)
 
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
-        httpd.allow_reuse_address = True
+    # One thread per request so a page's assets load in parallel; serve
+    # from OUTPUT_DIR without changing the process's working directory
+    handler = functools.partial(Handler, directory=str(OUTPUT_DIR))
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
+        httpd.daemon_threads = True
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
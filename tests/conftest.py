@@ -0,0 +1,29 @@
+import pytest
+import responses
+
+from concertvenues.scrapers import _http
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _in_memory_http_cache():
+    """Keep the shared session's cache in memory so tests don't create data/http_cache."""
+    _http._session = _http._build_session("tests", backend="memory")
+    yield
+    _http._session = None
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses():
+    """
+    Mock HTTP for every test with a fresh responses registry.
+
+    Any request without a registered response raises ConnectionError, so
+    tests never reach a real venue site. The shared session's cache is
+    disabled meanwhile, so a response cached by one test is never served to
+    another in place of its own mock.
+    """
+    with (
+        _http.get_session().cache_disabled(),
+        responses.RequestsMock(assert_all_requests_are_fired=False) as rsps,
+    ):
+        yield rsps
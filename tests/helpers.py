@@ -0,0 +1,22 @@
+from datetime import date
+from functools import cache
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@cache
+def load_fixture(name: str) -> str:
+    """Return the contents of tests/fixtures/<name>, reading each file once per run."""
+    return (FIXTURES_DIR / name).read_text()
+
+
+def frozen_date(today: date) -> type[date]:
+    """A date subclass whose today() is fixed, for monkeypatching a scraper's `date`."""
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls) -> date:
+            return today
+
+    return FrozenDate
@@ -0,0 +1,72 @@
+from datetime import date, time
+
+import pytest
+
+from concertvenues.scrapers._dateutils import infer_year, parse_time, rollover_cutoff
+from concertvenues.scrapers.electricballroom import _parse_date
+
+TODAY = date(2026, 10, 15)
+CUTOFF = rollover_cutoff(TODAY)
+
+
+def test_infer_year_keeps_recent_dates_in_current_year():
+    assert infer_year(1, 9, 2026, CUTOFF) == date(2026, 9, 1)
+
+
+def test_infer_year_rolls_over_new_year():
+    assert infer_year(12, 1, 2026, CUTOFF) == date(2027, 1, 12)
+
+
+def test_infer_year_cutoff_is_inclusive():
+    # Exactly 60 days back stays in the current year; one more day rolls over
+    assert infer_year(16, 8, 2026, CUTOFF) == date(2026, 8, 16)
+    assert infer_year(15, 8, 2026, CUTOFF) == date(2027, 8, 15)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Saturday 21st November", date(2026, 11, 21)),
+        ("Fri 2nd Jan", date(2027, 1, 2)),
+        ("3 March", date(2027, 3, 3)),
+        ("February 21st", date(2027, 2, 21)),
+        ("Saturday, November 21", date(2026, 11, 21)),
+        ("21/11/2026", date(2026, 11, 21)),
+        ("Fri 02.01.2026", date(2026, 1, 2)),
+        ("21-02", date(2027, 2, 21)),
+    ],
+)
+def test_electricballroom_parse_date(text, expected):
+    assert _parse_date(text, TODAY.year, CUTOFF) == expected
+
+
+@pytest.mark.parametrize("text", ["TBC", "", "Sat 21st", "Doors 7pm", "31/02/2026", "21/13"])
+def test_electricballroom_parse_date_rejects_garbage(text):
+    with pytest.raises(ValueError):
+        _parse_date(text, TODAY.year, CUTOFF)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("7:00pm", time(19, 0)),
+        ("7.30 PM", time(19, 30)),
+        ("22:30", time(22, 30)),
+        ("12am", time(0, 0)),
+        ("12pm", time(12, 0)),
+        (" 9pm ", time(21, 0)),
+        ("19:00-23:00", time(19, 0)),
+        ("19:00\n - 23:00", time(19, 0)),
+        ("7pm - 11pm", time(19, 0)),
+        ("7.30pm till late", time(19, 30)),
+        ("Doors 7pm", None),
+        ("25:00", None),
+        ("13pm", None),
+        ("123", None),
+        ("7pmish", None),
+        ("12:30:45", None),
+        ("", None),
+    ],
+)
+def test_parse_time(text, expected):
+    assert parse_time(text) == expected
@@ -0,0 +1,127 @@
+from datetime import date, time, timedelta
+
+import concertvenues.db as db_module
+from concertvenues.models import Event, EventRow, Venue
+
+
+def _event(url: str, **kwargs) -> Event:
+    defaults = {"venue_key": "testvenue", "title": "Test Act", "date": date.today()}
+    defaults.update(kwargs)
+    return Event(url=url, **defaults)
+
+
+def _connect(tmp_path):
+    conn = db_module.connect(tmp_path / "events.db")
+    db_module.upsert_venue(conn, Venue(key="testvenue", name="Test Venue", city="", url=""))
+    return conn
+
+
+def test_upsert_events_bulk_inserts_all(tmp_path):
+    conn = _connect(tmp_path)
+    events = [_event(f"https://example.com/{i}") for i in range(250)]
+
+    db_module.upsert_events_bulk(conn, events)
+
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 250
+
+
+def test_upsert_events_bulk_updates_existing(tmp_path):
+    conn = _connect(tmp_path)
+    db_module.upsert_events_bulk(conn, [_event("https://example.com/a")])
+    db_module.upsert_events_bulk(
+        conn,
+        [
+            _event("https://example.com/a", title="New Title", time=time(19, 30), sold_out=True),
+        ],
+    )
+
+    rows = conn.execute("SELECT title, time, sold_out FROM events").fetchall()
+    assert [tuple(r) for r in rows] == [("New Title", "19:30:00", 1)]
+
+
+def test_upsert_events_bulk_accepts_generator(tmp_path):
+    conn = _connect(tmp_path)
+    events = (_event(f"https://example.com/{i}") for i in range(150))
+
+    assert db_module.upsert_events_bulk(conn, events) == 150
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 150
+
+
+def test_get_upcoming_events_with_venues_joins_venue(tmp_path):
+    conn = _connect(tmp_path)
+    today = date.today()
+    db_module.upsert_events_bulk(
+        conn,
+        [
+            _event("https://example.com/a", time=time(20, 0), price="£10", sold_out=True),
+        ],
+    )
+
+    rows = db_module.get_upcoming_events_with_venues(conn, from_date=today)
+
+    assert rows == [
+        EventRow(
+            id=rows[0].id,
+            venue_key="testvenue",
+            title="Test Act",
+            date=today.isoformat(),
+            time="20:00:00",
+            url="https://example.com/a",
+            price="£10",
+            sold_out=1,
+            venue_name="Test Venue",
+            venue_url="",
+        )
+    ]
+
+
+def test_get_upcoming_events_with_venues_without_venue_row(tmp_path):
+    conn = _connect(tmp_path)
+    db_module.upsert_events_bulk(conn, [_event("https://example.com/a", venue_key="novenue")])
+
+    (row,) = db_module.get_upcoming_events_with_venues(conn)
+
+    # LEFT JOIN: falls back to the venue key and has no venue URL
+    assert (row.venue_key, row.venue_name, row.venue_url) == ("novenue", "novenue", None)
+
+
+def test_get_upcoming_events_with_venues_range_and_order(tmp_path):
+    conn = _connect(tmp_path)
+    start = date(2030, 1, 10)
+    end = start + timedelta(days=90)
+    db_module.upsert_events_bulk(
+        conn,
+        [
+            _event("https://example.com/after", date=end + timedelta(days=1)),
+            _event("https://example.com/last", date=end),
+            _event("https://example.com/late", date=start, time=time(21, 0)),
+            _event("https://example.com/early", date=start, time=time(19, 0)),
+            _event("https://example.com/notime", date=start),
+            _event("https://example.com/before", date=start - timedelta(days=1)),
+        ],
+    )
+
+    rows = db_module.get_upcoming_events_with_venues(conn, from_date=start)
+
+    # Both bounds are inclusive; untimed events sort first within a day
+    assert [r.url.rsplit("/", 1)[1] for r in rows] == ["notime", "early", "late", "last"]
+
+
+def test_upsert_event_and_get_upcoming_events_round_trip(tmp_path):
+    conn = _connect(tmp_path)
+    event = _event(
+        "https://example.com/a",
+        time=time(19, 30),
+        description="Support TBC",
+        image_url="https://example.com/a.jpg",
+        on_sale_date=date(2030, 1, 1),
+        price="£25",
+        sold_out=True,
+    )
+    db_module.upsert_event(conn, event)
+
+    (loaded,) = db_module.get_upcoming_events(conn)
+
+    assert loaded.id is not None
+    loaded.id = None
+    assert loaded == event
@@ -0,0 +1,26 @@
+from datetime import date, time
+
+from concertvenues.scrapers.earthackney import EarthAckneyScraper
+from tests.helpers import load_fixture
+
+URL = "https://earthackney.co.uk/events/"
+
+
+def test_earthackney_listing(mocked_responses):
+    mocked_responses.get(URL, body=load_fixture("earthackney.html"))
+
+    events = list(EarthAckneyScraper({"url": URL}).fetch_events())
+
+    # The past event and the look-alike list--events__item__other item are skipped
+    assert [(e.title, e.date, e.time, e.url, e.image_url, e.sold_out) for e in events] == [
+        (
+            "Band  One",
+            date(2099, 2, 27),
+            time(19, 0),
+            "https://earthackney.co.uk/events/a",
+            "https://img/a.jpg",
+            True,
+        ),
+        ("Band Two", date(2099, 3, 1), None, "https://earthackney.co.uk/events/b", None, False),
+    ]
+    assert all(e.venue_key == "earthackney" for e in events)
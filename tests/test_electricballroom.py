@@ -0,0 +1,29 @@
+import logging
+from datetime import date, time
+
+from concertvenues.scrapers import electricballroom
+from concertvenues.scrapers.electricballroom import ElectricBallroomScraper
+from tests.helpers import frozen_date, load_fixture
+
+URL = "https://electricballroom.co.uk/whats-on/"
+
+
+def test_electricballroom_listing(mocked_responses, monkeypatch, caplog):
+    monkeypatch.setattr(electricballroom, "date", frozen_date(date(2026, 10, 15)))
+    mocked_responses.get(URL, body=load_fixture("electricballroom.html"))
+
+    with caplog.at_level(logging.DEBUG, logger=electricballroom.__name__):
+        events = list(ElectricBallroomScraper({"url": URL}).fetch_events())
+
+    # Past, undated and unlinked cards are skipped; January rolls into next year
+    assert [(e.title, e.date, e.time, e.price, e.image_url, e.sold_out) for e in events] == [
+        ("Band A", date(2026, 11, 21), time(19, 0), "£25.00", "https://img/eb-a.jpg", True),
+        ("Club Night", date(2027, 1, 12), time(22, 30), "£10", "https://img/eb-b.jpg", True),
+        ("Band C", date(2026, 12, 5), None, None, None, False),
+    ]
+    assert [e.url for e in events] == [
+        "https://electricballroom.co.uk/event/a/",
+        "https://electricballroom.co.uk/event/b/",
+        "https://electricballroom.co.uk/event/c/",
+    ]
+    assert "unparseable date 'TBC'" in caplog.text
@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from concertvenues.scrapers import _http
+
+BODY_DELAY = 0.2  # seconds between sending the headers and the body
+
+
+class _SlowBodyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+        try:
+            body = b"x" * 1024
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.flush()
+            time.sleep(BODY_DELAY)
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server(mocked_responses):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowBodyHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.in_flight = server.peak = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    mocked_responses.add_passthru(url)
+    yield server, url
+    server.shutdown()
+    server.server_close()
+
+
+def test_per_host_limit_covers_body_download(slow_server, caplog):
+    server, url = slow_server
+    session = _http.get_session()
+
+    with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+        with ThreadPoolExecutor(max_workers=_http.MAX_WORKERS) as pool:
+            responses = list(
+                pool.map(lambda i: session.get(f"{url}{i}", timeout=10), range(_http.MAX_WORKERS))
+            )
+
+    assert all(r.content == b"x" * 1024 for r in responses)
+    assert server.peak <= _http.MAX_PER_HOST
+    assert "Connection pool is full" not in caplog.text
+
+
+def test_rate_limited_request_is_retried(mocked_responses):
+    url = "https://app.ticketmaster.com/discovery/v2/events.json"
+    mocked_responses.get(url, status=429)
+    mocked_responses.get(url, json={"page": {"totalPages": 1}})
+
+    r = _http.get_session().get(url, timeout=10)
+
+    assert r.status_code == 200
+    assert len(mocked_responses.calls) == 2
+
+
+def test_retry_backs_off_before_every_retry():
+    retry = _http._RETRY
+    waits = []
+    for _ in range(retry.total):
+        retry = retry.increment(method="GET", url="/", error=ConnectionError())
+        waits.append(retry.get_backoff_time())
+
+    assert waits == [0.3, 0.6]
+
+
+def test_rate_limited_host_is_spaced_out(mocked_responses, monkeypatch):
+    rate = 20
+    monkeypatch.setitem(_http._rate_limiters, "app.ticketmaster.com", _http._RateLimiter(rate))
+    sent = []
+
+    def record(request):
+        sent.append(time.monotonic())
+        return 200, {}, "{}"
+
+    url = "https://app.ticketmaster.com/discovery/v2/events.json"
+    mocked_responses.add_callback("GET", url, callback=record)
+    session = _http.get_session()
+
+    with ThreadPoolExecutor(max_workers=_http.MAX_PER_HOST) as pool:
+        list(pool.map(lambda i: session.get(url, params={"page": i}, timeout=10), range(8)))
+
+    sent.sort()
+    gaps = [b - a for a, b in zip(sent, sent[1:])]
+    assert len(sent) == 8
+    assert min(gaps) >= 1 / rate * 0.9
+
+
+def test_cache_file_follows_set_cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(_http, "_session", None)
+    monkeypatch.setattr(_http, "_cache_path", _http.CACHE_PATH)
+
+    _http.set_cache_path(tmp_path / "http_cache")
+    _http.get_session().close()
+
+    assert (tmp_path / "http_cache.sqlite").exists()
+    with pytest.raises(RuntimeError):
+        _http.set_cache_path(tmp_path / "elsewhere")
@@ -0,0 +1,57 @@
+from datetime import date, time
+
+from concertvenues.scrapers import jazzcafe
+from concertvenues.scrapers.jazzcafe import JazzCafeScraper
+from tests.helpers import frozen_date, load_fixture
+
+URL = "https://thejazzcafe.com/whats-on/"
+
+
+def test_jazzcafe_listing_and_details(mocked_responses, monkeypatch):
+    monkeypatch.setattr(jazzcafe, "date", frozen_date(date(2026, 10, 15)))
+    mocked_responses.get(URL, body=load_fixture("jazzcafe_listing.html"))
+    mocked_responses.get(
+        "https://thejazzcafe.com/event/one", body=load_fixture("jazzcafe_detail.html")
+    )
+    mocked_responses.get(
+        "https://thejazzcafe.com/event/two", body=load_fixture("jazzcafe_detail_sold_out.html")
+    )
+    mocked_responses.get("https://thejazzcafe.com/event/three", status=500)
+
+    events = JazzCafeScraper({"url": URL}).fetch_events()
+
+    # Past, unlinked and undated cards are skipped without fetching details
+    fetched = {call.request.url for call in mocked_responses.calls} - {URL}
+    assert fetched == {
+        "https://thejazzcafe.com/event/one",
+        "https://thejazzcafe.com/event/two",
+        "https://thejazzcafe.com/event/three",
+    }
+    by_url = {e.url: (e.title, e.date, e.time, e.price, e.sold_out) for e in events}
+    assert by_url == {
+        # Host subtitle dropped; two prices -> "From" the lowest; doors time
+        "https://thejazzcafe.com/event/one": (
+            "Artist One",
+            date(2026, 11, 21),
+            time(19, 0),
+            "From £25",
+            False,
+        ),
+        # January rolls into next year; sold-out block has text
+        "https://thejazzcafe.com/event/two": (
+            "Artist Two live",
+            date(2027, 1, 12),
+            time(20, 0),
+            "£18",
+            True,
+        ),
+        # A failed detail fetch still yields the listing fields
+        "https://thejazzcafe.com/event/three": (
+            "Artist Three",
+            date(2026, 12, 4),
+            None,
+            None,
+            False,
+        ),
+    }
+    assert all(e.venue_key == "jazzcafe" for e in events)
@@ -0,0 +1,87 @@
+from datetime import date, time, timedelta
+
+from responses import matchers
+
+from concertvenues.scrapers.o2academy import (
+    _API,
+    _PAGE_SIZE,
+    O2AcademyBrixtonScraper,
+    _fetch_amg_documents,
+)
+
+VENUE_ID = 3919
+
+
+def _docs(start: int, count: int) -> list[dict]:
+    return [{"id": i, "name": f"Act {i}"} for i in range(start, start + count)]
+
+
+def _add_page(rsps, docs: list[dict], page: int | None = None) -> None:
+    params = {"VenueIds": str(VENUE_ID), "PageSize": str(_PAGE_SIZE)}
+    if page is not None:
+        params["Page"] = str(page)
+    rsps.get(_API, json={"documents": docs}, match=[matchers.query_param_matcher(params)])
+
+
+def test_single_short_page_is_one_request(mocked_responses):
+    _add_page(mocked_responses, _docs(0, 3))
+
+    assert list(_fetch_amg_documents(VENUE_ID)) == _docs(0, 3)
+    assert len(mocked_responses.calls) == 1
+
+
+def test_full_page_is_followed_by_next_page(mocked_responses):
+    _add_page(mocked_responses, _docs(0, _PAGE_SIZE))
+    _add_page(mocked_responses, _docs(_PAGE_SIZE, 5), page=1)
+
+    assert list(_fetch_amg_documents(VENUE_ID)) == _docs(0, _PAGE_SIZE + 5)
+    assert len(mocked_responses.calls) == 2
+
+
+def test_one_based_paging_skips_repeated_first_page(mocked_responses):
+    _add_page(mocked_responses, _docs(0, _PAGE_SIZE))
+    _add_page(mocked_responses, _docs(0, _PAGE_SIZE), page=1)
+    _add_page(mocked_responses, _docs(_PAGE_SIZE, 5), page=2)
+
+    assert list(_fetch_amg_documents(VENUE_ID)) == _docs(0, _PAGE_SIZE + 5)
+    assert len(mocked_responses.calls) == 3
+
+
+def test_ignored_page_parameter_stops_paging(mocked_responses):
+    mocked_responses.get(_API, json={"documents": _docs(0, _PAGE_SIZE)})
+
+    assert list(_fetch_amg_documents(VENUE_ID)) == _docs(0, _PAGE_SIZE)
+    assert len(mocked_responses.calls) == 3
+
+
+def test_scraper_builds_events_from_documents(mocked_responses):
+    upcoming = date.today() + timedelta(days=7)
+    past = date.today() - timedelta(days=7)
+    lineup = [{"isPrimary": True, "encodedName": "the-band", "id": 42}]
+    _add_page(
+        mocked_responses,
+        [
+            {
+                "name": " The Band ",
+                "eventDate": f"{upcoming}T00:00:00Z",
+                "doorTime": "19:00",
+                "allTicketStatus": 3,
+                "lineup": lineup,
+            },
+            {"name": "Old Show", "eventDate": f"{past}T00:00:00Z", "lineup": lineup},
+        ],
+    )
+
+    events = list(O2AcademyBrixtonScraper({}).fetch_events())
+
+    assert len(events) == 1
+    event = events[0]
+    assert (event.title, event.date, event.time, event.sold_out) == (
+        "The Band",
+        upcoming,
+        time(19, 0),
+        True,
+    )
+    assert event.url == (
+        "https://www.academymusicgroup.com/o2academybrixton/events/the-band-tickets-ae42/"
+    )
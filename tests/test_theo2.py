@@ -0,0 +1,145 @@
+import re
+from datetime import date, time
+
+import orjson
+import pytest
+
+from concertvenues.scrapers import theo2
+from concertvenues.scrapers.theo2 import TheO2Scraper, _parse_detail
+from tests.helpers import load_fixture
+
+TODAY = date(2026, 10, 15)
+URL = "https://www.theo2.co.uk/events/detail/band-one"
+EVENT = {"@type": "MusicEvent", "startDate": "2099-03-21T18:30:00+00:00"}
+
+
+def _detail_page(*blocks) -> str:
+    scripts = "".join(
+        f'<script type="application/ld+json">{orjson.dumps(b).decode()}</script>' for b in blocks
+    )
+    return f"<html><head>{scripts}</head><body></body></html>"
+
+
+def test_detail_fixture_skips_non_event_blocks(mocked_responses):
+    mocked_responses.get(URL, body=load_fixture("theo2_detail.html"))
+
+    assert _parse_detail(URL, TODAY) == {
+        "date": date(2099, 3, 21),
+        "time": time(18, 30),
+        "sold_out": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        EVENT,
+        [{"@type": "BreadcrumbList"}, EVENT],
+        {"@context": "https://schema.org", "@graph": [{"@type": "WebPage"}, EVENT]},
+    ],
+    ids=["bare", "list", "graph"],
+)
+def test_detail_json_ld_shapes(mocked_responses, block):
+    mocked_responses.get(URL, body=_detail_page({"@type": "Organization"}, block))
+
+    assert _parse_detail(URL, TODAY) == {
+        "date": date(2099, 3, 21),
+        "time": time(18, 30),
+        "sold_out": False,
+    }
+
+
+def test_detail_midnight_start_has_no_time(mocked_responses):
+    mocked_responses.get(URL, body=_detail_page({**EVENT, "startDate": "2099-03-21T00:00:00Z"}))
+
+    assert _parse_detail(URL, TODAY)["time"] is None
+
+
+@pytest.mark.parametrize(
+    "blocks",
+    [
+        [{"@type": "Organization", "name": "The O2"}],
+        [{**EVENT, "eventStatus": "https://schema.org/EventCancelled"}],
+        [{**EVENT, "eventStatus": "https://schema.org/EventPostponed"}],
+        [{**EVENT, "startDate": "2026-10-14T19:00:00+01:00"}],
+    ],
+    ids=["no-event", "cancelled", "postponed", "past"],
+)
+def test_detail_without_upcoming_event_is_dropped(mocked_responses, blocks):
+    mocked_responses.get(URL, body=_detail_page(*blocks))
+
+    assert _parse_detail(URL, TODAY) is None
+
+
+def test_detail_fetch_error_is_dropped(mocked_responses):
+    mocked_responses.get(URL, status=404)
+
+    assert _parse_detail(URL, TODAY) is None
+
+
+def _scrape(monkeypatch, mocked_responses, listing: str) -> dict[str, str]:
+    """Run fetch_events over a listing, every detail page being EVENT; return url -> title."""
+    monkeypatch.setattr(TheO2Scraper, "_load_listing", lambda self: listing)
+    mocked_responses.get(re.compile(r".*/events/detail/.*"), body=_detail_page(EVENT))
+    events = TheO2Scraper({"url": theo2._BASE + "/events"}).fetch_events()
+    return {e.url: e.title for e in events}
+
+
+def test_listing_titles_from_h3(monkeypatch, mocked_responses):
+    titles = _scrape(monkeypatch, mocked_responses, load_fixture("theo2_listing.html"))
+
+    # band-one: h3 in the enclosing card; its second link is a duplicate.
+    # band-two: the h3 inside the link wins over the card's first h3.
+    assert titles == {
+        "https://www.theo2.co.uk/events/detail/band-one": "Band One",
+        "https://www.theo2.co.uk/events/detail/band-two": "Band Two",
+    }
+
+
+def test_listing_titles_without_h3(monkeypatch, mocked_responses):
+    listing = """<html><body>
+        <div><a href="/events/detail/band-three"> Band   Three </a></div>
+        <div><a href="/events/detail/mystery-act"><img src="x.jpg"></a></div>
+    </body></html>"""
+
+    titles = _scrape(monkeypatch, mocked_responses, listing)
+
+    # Link text, else a title made from the URL slug
+    assert titles == {
+        "https://www.theo2.co.uk/events/detail/band-three": "Band Three",
+        "https://www.theo2.co.uk/events/detail/mystery-act": "Mystery Act",
+    }
+
+
+def test_listing_without_events_returns_nothing(monkeypatch, caplog):
+    playwright_api = pytest.importorskip("playwright.sync_api")
+    empty = "<html><body><p>No events found</p></body></html>"
+
+    class FakePage:
+        def goto(self, url, **kwargs):
+            pass
+
+        def wait_for_selector(self, selector, **kwargs):
+            raise playwright_api.TimeoutError("Timeout 15000ms exceeded.")
+
+        def content(self):
+            return empty
+
+    class FakeContext:
+        def route(self, pattern, handler):
+            pass
+
+        def new_page(self):
+            return FakePage()
+
+        def close(self):
+            pass
+
+    class FakeBrowser:
+        def new_context(self):
+            return FakeContext()
+
+    monkeypatch.setattr(theo2, "get_browser", FakeBrowser)
+
+    assert TheO2Scraper({"url": theo2._BASE + "/events"}).fetch_events() == []
+    assert "no event links rendered" in caplog.text
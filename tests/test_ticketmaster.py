@@ -0,0 +1,71 @@
+from datetime import date, time
+
+from responses import matchers
+
+from concertvenues.scrapers.ticketmaster import _API, fetch_tm_events
+
+VENUE_ID = "KovZ91777W7"
+FALLBACK_URL = "https://www.kocolondon.com/"
+
+
+def _doc(name: str, day: int, status: str = "onsale", year: int = 2099, **start) -> dict:
+    return {
+        "name": name,
+        "url": f"https://tm/{name}",
+        "dates": {
+            "start": {"localDate": f"{year}-05-{day:02d}", **start},
+            "status": {"code": status},
+        },
+    }
+
+
+def _add_page(rsps, page: int, total_pages: int, docs: list[dict]) -> None:
+    body = {"page": {"number": page, "totalPages": total_pages}}
+    if docs:
+        body["_embedded"] = {"events": docs}
+    params = {"venueId": VENUE_ID, "size": "200", "page": str(page), "apikey": "key"}
+    rsps.get(_API, json=body, match=[matchers.query_param_matcher(params)])
+
+
+def _fetch() -> list:
+    return list(fetch_tm_events(VENUE_ID, "koko", FALLBACK_URL, "key"))
+
+
+def test_single_page(mocked_responses):
+    no_url = _doc("no-url", 4)
+    del no_url["url"]
+    docs = [
+        _doc("a", 1, localTime="19:30:00"),
+        _doc("b", 2, status="offsale", timeTBA=True, localTime="20:00:00"),
+        _doc("c", 3, status="cancelled"),
+        _doc("old", 3, year=2000),
+        no_url,
+    ]
+    _add_page(mocked_responses, 0, 1, docs)
+
+    events = _fetch()
+
+    assert [(e.title, e.date, e.time, e.url, e.sold_out) for e in events] == [
+        ("a", date(2099, 5, 1), time(19, 30), "https://tm/a", False),
+        ("b", date(2099, 5, 2), None, "https://tm/b", True),
+        ("no-url", date(2099, 5, 4), None, FALLBACK_URL, False),
+    ]
+    assert all(e.venue_key == "koko" for e in events)
+    assert len(mocked_responses.calls) == 1
+
+
+def test_pages_are_fetched_and_yielded_in_order(mocked_responses):
+    for page in range(3):
+        _add_page(
+            mocked_responses, page, 3, [_doc(f"p{page}-{i}", page * 2 + i + 1) for i in (0, 1)]
+        )
+
+    assert [e.title for e in _fetch()] == ["p0-0", "p0-1", "p1-0", "p1-1", "p2-0", "p2-1"]
+    assert len(mocked_responses.calls) == 3
+
+
+def test_zero_pages(mocked_responses):
+    _add_page(mocked_responses, 0, 0, [])
+
+    assert _fetch() == []
+    assert len(mocked_responses.calls) == 1